@@ -5,13 +5,34 @@ Calculate configurations with higher leverage while maintaining safety margins.
 """
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import Dict, Any, Optional, List, Tuple
-import json
+from typing import Dict, Any, List
 
 # Import bot functionality
 from funding_bot import AsterDexFundingBot, DEFAULT_SPOT_SYMBOL, DEFAULT_FUTURES_SYMBOL
 
+# Static closing notes printed after a successful analysis
+AGGRESSIVE_WARNINGS = f"""
+⚠️  AGGRESSIVE STRATEGY WARNINGS:
+{"=" * 40}
+   1. 🧪 ALWAYS test with small amounts first
+   2. 📊 Monitor funding rates more frequently
+   3. 🚨 Set tighter price alerts
+   4. 📱 Keep trading app open during high volatility
+   5. ⏰ Avoid running during major news events
+   6. 🔄 Have faster position closure plan
+   7. 📋 Monitor margin levels constantly
+   8. 🛑 Set automatic stop-loss if possible
+
+💡 RISK MANAGEMENT TIPS:
+   • Start with moderate risk profile
+   • Scale up gradually after successful runs
+   • Monitor liquidation levels closely
+   • Keep some margin in reserve
+   • Close positions if funding turns negative
+"""
+
 def analyze_aggressive_funding_strategy(capital: Decimal, futures_reserve: Decimal) -> Dict[str, Any]:
     """
     Analyze more aggressive funding fee strategies for higher returns.
@@ -47,9 +68,12 @@ def analyze_aggressive_funding_strategy(capital: Decimal, futures_reserve: Decim
             batch_quote=Decimal("100")
         )
         
-        # Get current market data
-        spot_price = bot._fetch_spot_price()
-        futures_price = bot._fetch_futures_price()
+        # Get current market data; both price reads are independent, so run them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            spot_price_future = executor.submit(bot._fetch_spot_price)
+            futures_price_future = executor.submit(bot._fetch_futures_price)
+            spot_price = spot_price_future.result()
+            futures_price = futures_price_future.result()
         
         print(f"📊 Current Market Data:")
         print(f"   Spot Price: {spot_price} USDT")
@@ -241,7 +265,7 @@ def analyze_aggressive_funding_strategy(capital: Decimal, futures_reserve: Decim
                         original_profit = capital * daily_rate
                         extra_profit = daily_profit - original_profit
                         
-                        print(f"     {rate_name} Daily: {daily_profit:.2f} USDT (+{extra_profit:.2f})")
+                        print(f"     {rate_name} Daily: {daily_profit:.2f} USDT ({extra_profit:+.2f})")
                     print()
                     
                     recommended_configs.append({
@@ -346,23 +370,7 @@ def main():
         print(f"❌ Analysis failed: {result.get('error', 'Unknown error')}")
         return
     
-    print(f"\n⚠️  AGGRESSIVE STRATEGY WARNINGS:")
-    print("=" * 40)
-    print("   1. 🧪 ALWAYS test with small amounts first")
-    print("   2. 📊 Monitor funding rates more frequently")
-    print("   3. 🚨 Set tighter price alerts")
-    print("   4. 📱 Keep trading app open during high volatility")
-    print("   5. ⏰ Avoid running during major news events")
-    print("   6. 🔄 Have faster position closure plan")
-    print("   7. 📋 Monitor margin levels constantly")
-    print("   8. 🛑 Set automatic stop-loss if possible")
-    
-    print(f"\n💡 RISK MANAGEMENT TIPS:")
-    print("   • Start with moderate risk profile")
-    print("   • Scale up gradually after successful runs")
-    print("   • Monitor liquidation levels closely")
-    print("   • Keep some margin in reserve")
-    print("   • Close positions if funding turns negative")
+    sys.stdout.write(AGGRESSIVE_WARNINGS)
 
 if __name__ == "__main__":
     main()
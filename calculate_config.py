@@ -3,11 +3,10 @@
 Configuration calculator for AsterDex Funding Bot.
 Calculate optimal batch sizes and validate margin requirements for custom capital amounts.
 """
-import math
 import os
-import sys
-from decimal import Decimal, ROUND_DOWN
-from typing import List, Tuple, Dict, Any
+from decimal import Decimal
+from operator import itemgetter
+from typing import List, Tuple, Dict
 
 # Import bot functionality
 from funding_bot import AsterDexFundingBot, DEFAULT_SPOT_SYMBOL, DEFAULT_FUTURES_SYMBOL
@@ -48,7 +47,7 @@ def find_optimal_batch_sizes(capital: Decimal, min_batch: Decimal = Decimal("50"
             unique_batches.append((batch_size, count, remainder))
     
     # Sort by batch count (fewer batches first), then by batch size
-    unique_batches.sort(key=lambda x: (x[1], x[0]))
+    unique_batches.sort(key=itemgetter(1, 0))
     
     return unique_batches[:10]  # Return top 10 options
 
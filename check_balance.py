@@ -3,11 +3,10 @@
 Balance checker and bot preparation script for AsterDex Funding Bot.
 This script checks account balances, symbol information, and validates bot configuration.
 """
-import json
 import os
 import sys
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 
 # Import the bot class to reuse its API functionality
 from funding_bot import AsterDexFundingBot, DEFAULT_CAPITAL_USD, DEFAULT_SPOT_SYMBOL, DEFAULT_FUTURES_SYMBOL, DEFAULT_BATCH_QUOTE
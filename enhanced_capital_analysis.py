@@ -4,7 +4,8 @@ Enhanced capital analysis for maximizing funding fee profits.
 Calculate optimal configurations using additional margin for higher capital deployment.
 """
 from decimal import Decimal
-from typing import Dict, List, Tuple
+from operator import itemgetter
+from typing import Dict, List
 
 def analyze_enhanced_capital_strategies():
     """Analyze strategies using additional capital from margin reserves."""
@@ -93,7 +94,7 @@ def analyze_enhanced_capital_strategies():
                 original_profit = original_capital * daily_rate
                 extra_profit = daily_profit - original_profit
                 
-                print(f"       {scenario_name}: {daily_profit:.2f} USDT (+{extra_profit:.2f})")
+                print(f"       {scenario_name}: {daily_profit:.2f} USDT ({extra_profit:+.2f})")
             print()
         else:
             shortfall = total_margin_needed - futures_reserve
@@ -206,7 +207,7 @@ def analyze_enhanced_capital_strategies():
             
             print(f"   {rate_name}:")
             print(f"     Original: {original_profit:.2f} USDT")
-            print(f"     Enhanced: {enhanced_profit:.2f} USDT (+{extra_profit:.2f})")
+            print(f"     Enhanced: {enhanced_profit:.2f} USDT ({extra_profit:+.2f})")
             print(f"     Improvement: {(enhanced_profit/original_profit-1)*100:.0f}%")
 
 def find_perfect_divisors(capital: Decimal) -> List[Dict]:
@@ -237,7 +238,7 @@ def find_perfect_divisors(capital: Decimal) -> List[Dict]:
             })
     
     # Sort by count (prefer fewer batches)
-    divisors.sort(key=lambda x: x["count"])
+    divisors.sort(key=itemgetter("count"))
     
     return divisors
 
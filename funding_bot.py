@@ -7,11 +7,17 @@ import logging
 import os
 import time
 from decimal import Decimal, ROUND_DOWN, getcontext
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlencode
 
 import requests
 
+# Prefer orjson for decoding API responses when it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Load environment variables from .env file if available
 try:
     from dotenv import load_dotenv
@@ -37,6 +43,7 @@ DEFAULT_FUTURES_SYMBOL = "ASTERUSDT"  # สัญญาฟิวเจอร์
 DEFAULT_BATCH_QUOTE = Decimal("200")  # ขนาดคำสั่งต่อรอบในหน่วย quote (USDT) หรือประมาณการที่ใช้คำนวณปริมาณขาย
 DEFAULT_BATCH_DELAY = 1.0  # เวลาหน่วงระหว่างรอบส่งคำสั่งแต่ละชุด (วินาที)
 DEFAULT_LOG_LEVEL = "INFO"  # ระดับความละเอียดของ log ขณะรัน
+MAX_RETRY_AFTER_SECONDS = 10.0  # เวลารอสูงสุดเมื่อโดน rate limit (HTTP 429) ก่อนลองใหม่
 
 MODE_BUY_SPOT_SHORT_FUTURES = "buy_spot_short_futures"  # โหมดซื้อสปอตและเปิดชอร์ตฟิวเจอร์สเพื่อ hedge
 MODE_SELL_SPOT_LONG_FUTURES = "sell_spot_long_futures"  # โหมดขายสปอตและเปิดลองฟิวเจอร์สเพื่อ hedge
@@ -109,6 +116,7 @@ class AsterDexFundingBot:
 
         self._api_key = api_key
         self._api_secret = api_secret.encode("utf-8")
+        self._hmac_template = hmac.new(self._api_secret, digestmod=hashlib.sha256)
         self._logger = logging.getLogger(self.__class__.__name__)
         self._logger.debug(
             "Initializing bot | capital=%s | spot=%s | futures=%s | batches=%s | delay=%s | mode=%s",
@@ -483,32 +491,60 @@ class AsterDexFundingBot:
     ) -> Any:
         url = f"{base_url}{path}"
         params = params or {}
-        if signed:
-            request_params = self._sign_params(params)
-        else:
-            request_params = dict(params)
+        method = method.upper()
+        for attempt in range(2):
+            # Signed requests are sent as the exact query string that was signed,
+            # so requests does not url-encode the parameters a second time.
+            request_params: Union[str, Dict[str, Any]]
+            if signed:
+                request_params = self._sign_params(params)
+            else:
+                request_params = dict(params)
+
+            if method == "GET":
+                response = self._session.get(url, params=request_params, timeout=10)
+            else:
+                response = self._session.request(
+                    method,
+                    url,
+                    data=request_params,
+                    headers={"Content-Type": "application/x-www-form-urlencoded"},
+                    timeout=10,
+                )
 
-        if method.upper() == "GET":
-            response = self._session.get(url, params=request_params, timeout=10)
-        else:
-            response = self._session.request(method.upper(), url, data=request_params, timeout=10)
+            # Rate limited reads are retried once after the server supplied Retry-After;
+            # orders are never replayed automatically.
+            if response.status_code != 429 or method != "GET" or attempt > 0:
+                break
+            retry_after = self._retry_after_seconds(response)
+            self._logger.warning("Rate limited on %s, retrying in %.1f seconds", path, retry_after)
+            time.sleep(retry_after)
 
         if response.status_code != 200:
-            raise RuntimeError(f"HTTP {response.status_code}: {response.text}")
+            body = response.content[:256].decode("utf-8", errors="replace")
+            raise RuntimeError(f"HTTP {response.status_code}: {body}")
 
-        data = response.json()
+        data = json_loads(response.content)
         if isinstance(data, dict) and "code" in data and data.get("code") not in (0, "0"):
             raise RuntimeError(f"API error: {data}")
         return data
 
-    def _sign_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _retry_after_seconds(self, response: requests.Response) -> float:
+        try:
+            retry_after = float(response.headers.get("Retry-After", "1"))
+        except ValueError:
+            retry_after = 1.0
+        return min(max(retry_after, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+    def _sign_params(self, params: Dict[str, Any]) -> str:
         payload = dict(params)
         payload.setdefault("recvWindow", self.recv_window)
         payload["timestamp"] = int(time.time() * 1000)
         query = urlencode(payload, doseq=True)
-        signature = hmac.new(self._api_secret, query.encode("utf-8"), hashlib.sha256).hexdigest()
-        payload["signature"] = signature
-        return payload
+        mac = self._hmac_template.copy()
+        mac.update(query.encode("utf-8"))
+        signature = mac.hexdigest()
+        return f"{query}&signature={signature}"
 
     def _floor_to_step(self, value: Decimal, step: Decimal) -> Decimal:
         if step <= 0:
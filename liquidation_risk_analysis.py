@@ -25,7 +25,7 @@ def analyze_liquidation_risk():
     print(f"   Mark Price: {mark_price} USDT")
     print(f"   Margin: {margin} USDT")
     print(f"   Liquidation Price: {liquidation_price} USDT")
-    print(f"   Current PnL: +{current_pnl} USDT")
+    print(f"   Current PnL: {current_pnl:+} USDT")
     print()
     
     # Calculate risk metrics
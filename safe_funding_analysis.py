@@ -5,12 +5,34 @@ Focus on maximum safety while collecting funding fees.
 """
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import Dict, Any, Optional
-import json
+from typing import Dict, Any
 
 # Import bot functionality
 from funding_bot import AsterDexFundingBot, DEFAULT_SPOT_SYMBOL, DEFAULT_FUTURES_SYMBOL
+from calculate_config import analyze_funding_profitability
+
+# Static closing notes printed after a successful analysis
+SAFETY_TIPS = f"""
+💡 ADDITIONAL SAFETY TIPS:
+{"=" * 40}
+   1. 🧪 Test with 100 USDT first
+   2. 📊 Monitor funding rates hourly
+   3. 🚨 Set price alerts for ASTERUSDT
+   4. 📱 Keep AsterDex app open during execution
+   5. ⏰ Run during stable market hours
+   6. 🔄 Plan position closure strategy
+   7. 📋 Keep detailed records
+   8. 🛑 Have stop-loss plan ready
+
+🎯 FUNDING FEE COLLECTION STRATEGY:
+   • Hold positions through funding periods
+   • Collect fees 3 times per day (every 8 hours)
+   • Maintain market-neutral exposure
+   • Monitor and adjust if needed
+   • Close positions when funding turns negative
+"""
 
 def analyze_safe_funding_strategy(capital: Decimal, futures_reserve: Decimal) -> Dict[str, Any]:
     """
@@ -47,9 +69,16 @@ def analyze_safe_funding_strategy(capital: Decimal, futures_reserve: Decimal) ->
             batch_quote=Decimal("100")
         )
         
-        # Get current market data
-        spot_price = bot._fetch_spot_price()
-        futures_price = bot._fetch_futures_price()
+        # Get current market data; the four REST calls are independent, so run them concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            spot_price_future = executor.submit(bot._fetch_spot_price)
+            futures_price_future = executor.submit(bot._fetch_futures_price)
+            spot_info_future = executor.submit(bot._get_spot_symbol_info)
+            futures_info_future = executor.submit(bot._get_futures_symbol_info)
+            spot_price = spot_price_future.result()
+            futures_price = futures_price_future.result()
+            spot_info = spot_info_future.result()
+            futures_info = futures_info_future.result()
         
         print(f"📊 Current Market Data:")
         print(f"   Spot Price: {spot_price} USDT")
@@ -59,9 +88,6 @@ def analyze_safe_funding_strategy(capital: Decimal, futures_reserve: Decimal) ->
         print(f"   Price Difference: {price_diff:.6f} USDT ({price_diff_pct:.4f}%)")
         
         # Check symbol info for trading limits
-        spot_info = bot._get_spot_symbol_info()
-        futures_info = bot._get_futures_symbol_info()
-        
         spot_step, spot_min_qty = bot._extract_step_and_min_qty(spot_info)
         futures_step, futures_min_qty = bot._extract_step_and_min_qty(futures_info)
         futures_min_notional = bot._extract_min_notional(futures_info)
@@ -156,17 +182,13 @@ def analyze_safe_funding_strategy(capital: Decimal, futures_reserve: Decimal) ->
         
         print(f"\n📈 CONSERVATIVE PROFIT PROJECTIONS:")
         for scenario_name, funding_rate in conservative_scenarios:
-            daily_rate = funding_rate * 3  # 3 times per day
-            daily_profit = capital * daily_rate
-            weekly_profit = daily_profit * 7
-            monthly_profit = daily_profit * 30
-            apy = (daily_rate * 365) * 100
+            profit_calc = analyze_funding_profitability(capital, funding_rate)
             
             print(f"   {scenario_name} ({funding_rate*100:.3f}% per 8h):")
-            print(f"     Daily: {daily_profit:.2f} USDT")
-            print(f"     Weekly: {weekly_profit:.2f} USDT")
-            print(f"     Monthly: {monthly_profit:.2f} USDT")
-            print(f"     APY: {apy:.2f}%")
+            print(f"     Daily: {profit_calc['daily_profit']:.2f} USDT")
+            print(f"     Weekly: {profit_calc['weekly_profit']:.2f} USDT")
+            print(f"     Monthly: {profit_calc['monthly_profit']:.2f} USDT")
+            print(f"     APY: {profit_calc['apy_percent']:.2f}%")
             print()
         
         # Recommended safest configuration
@@ -246,23 +268,7 @@ def main():
         print(f"\n❌ Cannot proceed safely: {result['error']}")
         return
     
-    print(f"\n💡 ADDITIONAL SAFETY TIPS:")
-    print("=" * 40)
-    print("   1. 🧪 Test with 100 USDT first")
-    print("   2. 📊 Monitor funding rates hourly")
-    print("   3. 🚨 Set price alerts for ASTERUSDT")
-    print("   4. 📱 Keep AsterDex app open during execution")
-    print("   5. ⏰ Run during stable market hours")
-    print("   6. 🔄 Plan position closure strategy")
-    print("   7. 📋 Keep detailed records")
-    print("   8. 🛑 Have stop-loss plan ready")
-    
-    print(f"\n🎯 FUNDING FEE COLLECTION STRATEGY:")
-    print("   • Hold positions through funding periods")
-    print("   • Collect fees 3 times per day (every 8 hours)")
-    print("   • Maintain market-neutral exposure")
-    print("   • Monitor and adjust if needed")
-    print("   • Close positions when funding turns negative")
+    sys.stdout.write(SAFETY_TIPS)
 
 if __name__ == "__main__":
     main()